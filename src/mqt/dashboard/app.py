@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from flask import Flask, render_template
 
+from .paths import data_file
 from .visualization import create_summary_cards
 
 app = Flask(__name__, template_folder="templates")
@@ -12,6 +15,22 @@ app = Flask(__name__, template_folder="templates")
 @app.route("/")
 def index() -> str:
     """Return the index page with summary cards."""
+    return render_index(data_file.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def render_index(data_mtime_ns: int) -> str:  # ruff: ignore[unused-function-argument]
+    """Render the index page for a given version of the collected data.
+
+    The data only changes when it is collected again, so the rendered page is
+    cached until the modification time of the data file changes.
+
+    Args:
+        data_mtime_ns: The modification time of the data file in nanoseconds.
+
+    Returns:
+        The rendered index page.
+    """
     sorted_by_stars, sorted_by_downloads, total_stars, total_downloads = create_summary_cards()
     return render_template(
         "index.html",
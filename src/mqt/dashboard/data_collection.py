@@ -4,58 +4,56 @@ from __future__ import annotations
 
 import operator
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from typing import NamedTuple
 
+import orjson
 import pandas as pd
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from .paths import data_file
 
 # Load environment variables from .env file
 load_dotenv()
 
-repos = [
+
+class RepoSpec(NamedTuple):
+    """Specification of a repository to collect data for."""
+
+    github_repo: str
+    org: str
+    pypi_package: str | None = None
+    docs_slug: str | None = None
+
+
+repos: tuple[RepoSpec, ...] = (
     # Repos in the munich-quantum-toolkit organization
-    {"github_repo": "core", "org": "munich-quantum-toolkit", "pypi_package": "mqt-core", "docs_slug": "core"},
-    {"github_repo": "ddsim", "org": "munich-quantum-toolkit", "pypi_package": "mqt-ddsim", "docs_slug": "ddsim"},
-    {"github_repo": "qmap", "org": "munich-quantum-toolkit", "pypi_package": "mqt-qmap", "docs_slug": "qmap"},
-    {"github_repo": "qcec", "org": "munich-quantum-toolkit", "pypi_package": "mqt-qcec", "docs_slug": "qcec"},
-    {"github_repo": "qecc", "org": "munich-quantum-toolkit", "pypi_package": "mqt-qecc", "docs_slug": "qecc"},
-    {"github_repo": "bench", "org": "munich-quantum-toolkit", "pypi_package": "mqt-bench", "docs_slug": "bench"},
-    {
-        "github_repo": "predictor",
-        "org": "munich-quantum-toolkit",
-        "pypi_package": "mqt-predictor",
-        "docs_slug": "predictor",
-    },
-    {"github_repo": "syrec", "org": "munich-quantum-toolkit", "pypi_package": "mqt-syrec", "docs_slug": "syrec"},
-    {"github_repo": "qusat", "org": "munich-quantum-toolkit", "pypi_package": "mqt-qusat", "docs_slug": "qusat"},
-    {
-        "github_repo": "debugger",
-        "org": "munich-quantum-toolkit",
-        "pypi_package": "mqt-debugger",
-        "docs_slug": "debugger",
-    },
-    {"github_repo": "yaqs", "org": "munich-quantum-toolkit", "pypi_package": "mqt-yaqs", "docs_slug": "yaqs"},
-    {"github_repo": "naviz", "org": "munich-quantum-toolkit", "pypi_package": "mqt-naviz", "docs_slug": "naviz"},
-    {
-        "github_repo": "problemsolver",
-        "org": "munich-quantum-toolkit",
-        "pypi_package": "mqt-problemsolver",
-        "docs_slug": "problemsolver",
-    },
-    {"github_repo": "qudits", "org": "munich-quantum-toolkit", "pypi_package": "mqt-qudits", "docs_slug": "qudits"},
-    {
-        "github_repo": "ionshuttler",
-        "org": "munich-quantum-toolkit",
-        "pypi_package": "mqt-ionshuttler",
-        "docs_slug": "ionshuttler",
-    },
-    {"github_repo": "ddvis", "org": "munich-quantum-toolkit"},
-    {"github_repo": "workflows", "org": "munich-quantum-toolkit"},
-    {"github_repo": "templates", "org": "munich-quantum-toolkit"},
-    {"github_repo": ".github", "org": "munich-quantum-toolkit"},
-]
+    RepoSpec("core", "munich-quantum-toolkit", "mqt-core", "core"),
+    RepoSpec("ddsim", "munich-quantum-toolkit", "mqt-ddsim", "ddsim"),
+    RepoSpec("qmap", "munich-quantum-toolkit", "mqt-qmap", "qmap"),
+    RepoSpec("qcec", "munich-quantum-toolkit", "mqt-qcec", "qcec"),
+    RepoSpec("qecc", "munich-quantum-toolkit", "mqt-qecc", "qecc"),
+    RepoSpec("bench", "munich-quantum-toolkit", "mqt-bench", "bench"),
+    RepoSpec("predictor", "munich-quantum-toolkit", "mqt-predictor", "predictor"),
+    RepoSpec("syrec", "munich-quantum-toolkit", "mqt-syrec", "syrec"),
+    RepoSpec("qusat", "munich-quantum-toolkit", "mqt-qusat", "qusat"),
+    RepoSpec("debugger", "munich-quantum-toolkit", "mqt-debugger", "debugger"),
+    RepoSpec("yaqs", "munich-quantum-toolkit", "mqt-yaqs", "yaqs"),
+    RepoSpec("naviz", "munich-quantum-toolkit", "mqt-naviz", "naviz"),
+    RepoSpec("problemsolver", "munich-quantum-toolkit", "mqt-problemsolver", "problemsolver"),
+    RepoSpec("qudits", "munich-quantum-toolkit", "mqt-qudits", "qudits"),
+    RepoSpec("ionshuttler", "munich-quantum-toolkit", "mqt-ionshuttler", "ionshuttler"),
+    RepoSpec("ddvis", "munich-quantum-toolkit"),
+    RepoSpec("workflows", "munich-quantum-toolkit"),
+    RepoSpec("templates", "munich-quantum-toolkit"),
+    RepoSpec(".github", "munich-quantum-toolkit"),
+)
 
 github_base_url = "https://api.github.com/repos/"
 pypistats_base_url = "https://pypistats.org/api/packages/"
@@ -66,6 +64,16 @@ pepy_base_url = "https://api.pepy.tech/api/v2/projects/"
 pypistats_request_interval_seconds = 12
 pypistats_rate_limit_retry_seconds = 60
 _last_pypistats_request = 0.0
+_pypistats_lock = threading.Lock()
+
+# Pepy answers with HTTP 429 once the API key's quota is exhausted. Honor its
+# Retry-After header and otherwise back off exponentially, but give up eventually.
+pepy_rate_limit_retry_seconds = 5
+pepy_max_retries = 6
+
+# Repositories are collected concurrently since the run time is dominated by network
+# latency. PyPI Stats requests remain serialized by ``_pypistats_lock``.
+collection_workers = 8
 
 github_token = os.getenv("GITHUB_TOKEN")
 github_headers = {"Authorization": f"token {github_token}"} if github_token else {}
@@ -73,6 +81,42 @@ github_headers = {"Authorization": f"token {github_token}"} if github_token else
 pepy_api_key = os.getenv("PEPY_API_KEY")
 pepy_headers = {"X-Api-Key": pepy_api_key} if pepy_api_key else {}
 
+# A shared session keeps connections to each API alive across requests instead of
+# repeating the TCP/TLS handshake for every call. The pool is sized for the
+# collection workers. Transient server errors are retried here, while rate limits
+# (HTTP 429) are handled by the individual API clients.
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=collection_workers,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=1.0,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+def get_retry_seconds(response: requests.Response, default: float) -> float:
+    """Determine how long to wait before retrying a rate-limited request.
+
+    Args:
+        response: The rate-limited response.
+        default: The delay to use if the response has no usable Retry-After header.
+
+    Returns:
+        The number of seconds to wait before retrying.
+    """
+    retry_after = response.headers.get("Retry-After")
+    try:
+        return float(retry_after) if retry_after else default
+    except ValueError:
+        return default
+
 
 def get_github_data(org: str, repo: str) -> dict[str, int | str | None]:
     """Fetch GitHub data for a given repository.
@@ -85,11 +129,11 @@ def get_github_data(org: str, repo: str) -> dict[str, int | str | None]:
         A dictionary containing the number of stars, latest release version, and published date.
     """
     url = f"{github_base_url}{org}/{repo}"
-    response = requests.get(url, headers=github_headers, timeout=60)
-    data = response.json()
+    response = session.get(url, headers=github_headers, timeout=60)
+    data = orjson.loads(response.content)
     version_url = f"{url}/releases/latest"
-    version_response = requests.get(version_url, headers=github_headers, timeout=60)
-    version_data = version_response.json()
+    version_response = session.get(version_url, headers=github_headers, timeout=60)
+    version_data = orjson.loads(version_response.content)
     return {
         "stars": data.get("stargazers_count", 0),
         "latest_release_version": version_data.get("tag_name", "No release"),
@@ -105,16 +149,21 @@ def get_pepy_data(package: str) -> dict[str, int | float | None]:
 
     Returns:
         A dictionary containing total downloads and other statistics.
+
+    Raises:
+        RuntimeError: If Pepy keeps rejecting the request due to rate limiting.
     """
     pepy_url = f"{pepy_base_url}{package}"
-    while True:
-        pepy_response = requests.get(pepy_url, headers=pepy_headers, timeout=60)
-        if pepy_response.status_code == 429:
-            print("Rate limit exceeded. Waiting 60 seconds before retrying...")
-            time.sleep(60)
-        else:
-            break
-    return pepy_response.json()  # type: ignore[no-any-return]
+    retries = 0
+    while (pepy_response := session.get(pepy_url, headers=pepy_headers, timeout=60)).status_code == 429:
+        if retries == pepy_max_retries:
+            msg = f"Pepy rate limit still exceeded for {package} after {retries} retries"
+            raise RuntimeError(msg)
+        retry_seconds = get_retry_seconds(pepy_response, pepy_rate_limit_retry_seconds * 2**retries)
+        print(f"Pepy rate limit exceeded. Waiting {retry_seconds:g} seconds before retrying...")
+        time.sleep(retry_seconds)
+        retries += 1
+    return orjson.loads(pepy_response.content)  # type: ignore[no-any-return]
 
 
 def get_pypistats_data(package: str) -> list[dict[str, int | str]]:
@@ -126,28 +175,25 @@ def get_pypistats_data(package: str) -> list[dict[str, int | str]]:
     global _last_pypistats_request  # ruff: ignore[global-statement]
 
     overall_downloads_url = f"{pypistats_base_url}{package}/overall"
-    while True:
-        elapsed = time.monotonic() - _last_pypistats_request
-        if elapsed < pypistats_request_interval_seconds:
-            time.sleep(pypistats_request_interval_seconds - elapsed)
-
-        downloads_response = requests.get(
-            overall_downloads_url,
-            params={"mirrors": "false"},
-            timeout=60,
-        )
-        _last_pypistats_request = time.monotonic()
-        if downloads_response.status_code != 429:
-            downloads_response.raise_for_status()
-            return downloads_response.json().get("data", [])  # type: ignore[no-any-return]
-
-        retry_after = downloads_response.headers.get("Retry-After")
-        try:
-            retry_seconds = float(retry_after) if retry_after else pypistats_rate_limit_retry_seconds
-        except ValueError:
-            retry_seconds = pypistats_rate_limit_retry_seconds
-        print(f"PyPI Stats rate limit exceeded. Waiting {retry_seconds:g} seconds before retrying...")
-        time.sleep(retry_seconds)
+    with _pypistats_lock:
+        while True:
+            elapsed = time.monotonic() - _last_pypistats_request
+            if elapsed < pypistats_request_interval_seconds:
+                time.sleep(pypistats_request_interval_seconds - elapsed)
+
+            downloads_response = session.get(
+                overall_downloads_url,
+                params={"mirrors": "false"},
+                timeout=60,
+            )
+            _last_pypistats_request = time.monotonic()
+            if downloads_response.status_code != 429:
+                downloads_response.raise_for_status()
+                return orjson.loads(downloads_response.content).get("data", [])  # type: ignore[no-any-return]
+
+            retry_seconds = get_retry_seconds(downloads_response, pypistats_rate_limit_retry_seconds)
+            print(f"PyPI Stats rate limit exceeded. Waiting {retry_seconds:g} seconds before retrying...")
+            time.sleep(retry_seconds)
 
 
 def get_pypi_data(package: str) -> dict[str, int | float | None]:
@@ -182,50 +228,76 @@ def get_pypi_data(package: str) -> dict[str, int | float | None]:
     }
 
 
+def collect_repo_data(repo: RepoSpec, timestamp: datetime) -> dict[str, int | float | str | datetime | None]:
+    """Collect data from GitHub and PyPI for a single repository.
+
+    Args:
+        repo: The repository specification (e.g., an entry of ``repos``).
+        timestamp: The timestamp of the current collection run.
+
+    Returns:
+        A dictionary containing the collected data for the repository.
+    """
+    github_data = get_github_data(repo.org, repo.github_repo)
+    if repo.pypi_package is not None:
+        pypi_data = get_pypi_data(repo.pypi_package)
+        repo_identifier = repo.pypi_package
+    else:
+        pypi_data = {
+            "daily_downloads": None,
+            "weekly_downloads": None,
+            "monthly_downloads": None,
+            "total_downloads": None,
+        }
+        repo_identifier = repo.github_repo
+    return {
+        "timestamp": timestamp,
+        "repo": repo_identifier,
+        "docs_slug": repo.docs_slug,
+        "github_link": f"https://github.com/{repo.org}/{repo.github_repo}",
+        "pypi_link": f"https://pypi.org/project/{repo.pypi_package}" if repo.pypi_package is not None else "",
+        "docs_link": f"https://mqt.readthedocs.io/en/stable/{repo.docs_slug}/" if repo.docs_slug is not None else "",
+        "stars": github_data["stars"],
+        "latest_release_version": github_data["latest_release_version"],
+        "published_at": github_data["published_at"],
+        "daily_downloads": pypi_data["daily_downloads"],
+        "weekly_downloads": pypi_data["weekly_downloads"],
+        "monthly_downloads": pypi_data["monthly_downloads"],
+        "total_downloads": pypi_data["total_downloads"],
+    }
+
+
 def collect_data() -> pd.DataFrame:
     """Collect data from GitHub and PyPI for the specified repositories.
 
     Returns:
         A pandas DataFrame containing the collected data.
     """
-    data = []
     timestamp = datetime.now(tz=UTC)
-    for repo in repos:
-        repo_name = repo["github_repo"]
-        repo_org = repo["org"]
-        print(f"Collecting data for {repo_org}/{repo_name}...")
-        github_data = get_github_data(repo_org, repo_name)
-        if "pypi_package" in repo:
-            pypi_name = repo["pypi_package"]
-            pypi_data = get_pypi_data(pypi_name)
-            repo_identifier = pypi_name
-        else:
-            pypi_data = {
-                "daily_downloads": None,
-                "weekly_downloads": None,
-                "monthly_downloads": None,
-                "total_downloads": None,
-            }
-            repo_identifier = repo_name
-        data.append({
-            "timestamp": timestamp,
-            "repo": repo_identifier,
-            "docs_slug": repo.get("docs_slug", None),
-            "stars": github_data["stars"],
-            "latest_release_version": github_data["latest_release_version"],
-            "published_at": github_data["published_at"],
-            "daily_downloads": pypi_data["daily_downloads"],
-            "weekly_downloads": pypi_data["weekly_downloads"],
-            "monthly_downloads": pypi_data["monthly_downloads"],
-            "total_downloads": pypi_data["total_downloads"],
-        })
-    repo_data = pd.DataFrame(data)
-    repo_data.to_csv("data/mqt.csv")
+    data = []
+    print(f"Collecting data for {len(repos)} repositories...")
+    with ThreadPoolExecutor(max_workers=collection_workers) as executor:
+        results = executor.map(lambda repo: collect_repo_data(repo, timestamp), repos)
+        # Report progress from the main thread so that the log lines do not interleave.
+        for repo, result in zip(repos, results, strict=True):
+            print(f"Collected data for {repo.org}/{repo.github_repo}.")
+            data.append(result)
+    # Store counts as nullable integers so that repositories without PyPI data do
+    # not turn the download columns into floats.
+    repo_data = pd.DataFrame(data).astype({
+        "stars": "Int64",
+        "daily_downloads": "Int64",
+        "weekly_downloads": "Int64",
+        "monthly_downloads": "Int64",
+        "total_downloads": "Int64",
+    })
+    repo_data["published_at"] = pd.to_datetime(repo_data["published_at"], format="ISO8601", errors="coerce")
+    repo_data.to_parquet(data_file, engine="pyarrow", compression="zstd", index=False)
     return repo_data
 
 
 def main() -> None:
-    """Main function to collect data and save it to a CSV file."""
+    """Main function to collect data and save it to a Parquet file."""
     repo_data = collect_data()
     print("Data collection complete. Latest data:")
     print(repo_data)
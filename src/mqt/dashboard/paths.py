@@ -0,0 +1,9 @@
+"""Paths shared by the data collection and the dashboard."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+# The collected data is stored as Parquet, which preserves the column types so that
+# the dashboard does not need to parse and infer them again on every read.
+data_file = Path("data/mqt.parquet")
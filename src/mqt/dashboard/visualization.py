@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import operator
+
+import numpy as np
 import pandas as pd
 
+from .paths import data_file
+
 
 def create_summary_cards() -> tuple[list[dict], list[dict], str, str]:  # type: ignore[type-arg]
     """Create summary cards for the MQT dashboard.
@@ -15,43 +20,27 @@ def create_summary_cards() -> tuple[list[dict], list[dict], str, str]:  # type:
         - The total number of stars across all repositories.
         - The total number of downloads formatted as a string.
     """
-    repo_data = pd.read_csv("data/mqt.csv", parse_dates=["timestamp"])
-    latest_data = repo_data.groupby("repo").last().reset_index()
-
-    latest_data["published_at"] = pd.to_datetime(latest_data["published_at"], errors="coerce")
-    latest_data["published_at"] = latest_data["published_at"].apply(
-        lambda x: x.strftime("%d %B %Y") if pd.notna(x) else "No release"  # type: ignore[redundant-expr]
-    )
+    repo_data = pd.read_parquet(data_file)
+    latest_data = repo_data.sort_values("timestamp", kind="mergesort").drop_duplicates("repo", keep="last")
 
-    latest_data["github_link"] = latest_data["repo"].apply(lambda x: f"https://github.com/cda-tum/{x}")
-    latest_data["pypi_link"] = latest_data.apply(
-        lambda x: f"https://pypi.org/project/{x['repo']}" if pd.notna(x["daily_downloads"]) else "",
-        axis=1,
-    )
-    latest_data["docs_link"] = latest_data.apply(
-        lambda x: f"https://mqt.readthedocs.io/en/stable/{x['docs_slug']}/" if pd.notna(x["docs_slug"]) else "", axis=1
-    )
+    latest_data["published_at"] = latest_data["published_at"].dt.strftime("%d %B %Y").fillna("No release")
 
-    # Sort by total downloads (without formatting)
+    # Sort by total downloads and sum up the latest snapshot (without formatting)
     latest_data = latest_data.sort_values(by="total_downloads", ascending=False)
+    totals = latest_data[["stars", "total_downloads"]].fillna(0).astype("int64").sum()
 
     # Format download numbers
-    latest_data["total_downloads"] = latest_data["total_downloads"].apply(format_count)
-    latest_data["daily_downloads"] = latest_data["daily_downloads"].apply(format_count)
-    latest_data["weekly_downloads"] = latest_data["weekly_downloads"].apply(format_count)
-    latest_data["monthly_downloads"] = latest_data["monthly_downloads"].apply(format_count)
+    for column in ("total_downloads", "daily_downloads", "weekly_downloads", "monthly_downloads"):
+        latest_data[column] = format_counts(latest_data[column])
 
     sorted_by_downloads = latest_data.to_dict(orient="records")
-    sorted_by_stars = latest_data.sort_values(by="stars", ascending=False).to_dict(orient="records")
-
-    total_stars = latest_data["stars"].sum()
-    total_downloads = repo_data["total_downloads"].sum()
+    sorted_by_stars = sorted(sorted_by_downloads, key=operator.itemgetter("stars"), reverse=True)
 
     return (
         sorted_by_stars,
         sorted_by_downloads,
-        format_count(total_stars),
-        format_count(total_downloads),
+        format_count(totals["stars"]),
+        format_count(totals["total_downloads"]),
     )
 
 
@@ -64,8 +53,22 @@ def format_count(count: float) -> str:
     Returns:
         A formatted string representing the count.
     """
-    if count >= 1e6:
-        return f"{count / 1e6:.1f}m"
-    if count >= 1e3:
-        return f"{count / 1e3:.1f}k"
-    return f"{count:.0f}"
+    return str(format_counts(pd.Series([count])).iloc[0])
+
+
+def format_counts(counts: pd.Series) -> pd.Series:
+    """Format a series of counts into human-readable strings.
+
+    Args:
+        counts: The counts to format.
+
+    Returns:
+        A series of formatted strings representing the counts.
+    """
+    values = counts.to_numpy(dtype=float, na_value=np.nan)
+    formatted = np.select(
+        [values >= 1e6, values >= 1e3],
+        [np.strings.mod("%.1fm", values / 1e6), np.strings.mod("%.1fk", values / 1e3)],
+        default=np.strings.mod("%.0f", values),
+    )
+    return pd.Series(formatted, index=counts.index)